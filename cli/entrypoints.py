@@ -26,7 +26,9 @@ def serve() -> None:
 
     from cli.process_registry import kill_all_best_effort
     from config.settings import get_settings
+    from core.event_loop import install_uvloop
 
+    install_uvloop()
     settings = get_settings()
     try:
         uvicorn.run(
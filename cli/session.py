@@ -7,6 +7,7 @@ from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 from loguru import logger
 
 from .process_registry import register_pid, unregister_pid
@@ -14,6 +15,9 @@ from .process_registry import register_pid, unregister_pid
 # Cap stderr capture so a runaway child cannot exhaust memory; pipe is still drained.
 _MAX_STDERR_CAPTURE_BYTES = 256 * 1024
 
+# Nested event keys that may carry the session ID, most likely first.
+_NESTED_SESSION_KEYS = ("init", "system", "result", "metadata")
+
 
 @dataclass(frozen=True, slots=True)
 class ClaudeCliConfig:
@@ -54,8 +58,35 @@ class CLISession:
         self._log_raw_cli_diagnostics = log_raw_cli_diagnostics
         self.process: asyncio.subprocess.Process | None = None
         self.current_session_id: str | None = None
-        self._is_busy = False
-        self._cli_lock = asyncio.Lock()
+        self._active_tasks = 0
+        self._active_procs: set[asyncio.subprocess.Process] = set()
+
+        # Child env and static argv parts are identical for every task, so
+        # build them once instead of copying ~200 environ entries per launch.
+        env = os.environ.copy()
+        if "ANTHROPIC_API_KEY" not in env:
+            env["ANTHROPIC_API_KEY"] = "sk-placeholder-key-for-proxy"
+        env["ANTHROPIC_API_URL"] = self.api_url
+        if self.api_url.endswith("/v1"):
+            env["ANTHROPIC_BASE_URL"] = self.api_url[:-3]
+        else:
+            env["ANTHROPIC_BASE_URL"] = self.api_url
+        env["TERM"] = "dumb"
+        env["PYTHONIOENCODING"] = "utf-8"
+        self._base_env = env
+
+        static_args = [
+            "--output-format",
+            "stream-json",
+            "--dangerously-skip-permissions",
+            "--verbose",
+        ]
+        for d in self.allowed_dirs:
+            static_args.extend(["--add-dir", d])
+        if self.plans_directory is not None:
+            settings_json = json.dumps({"plansDirectory": self.plans_directory})
+            static_args.extend(["--settings", settings_json])
+        self._static_cli_args: tuple[str, ...] = tuple(static_args)
 
     @staticmethod
     async def _drain_stderr_bounded(
@@ -88,7 +119,7 @@ class CLISession:
     @property
     def is_busy(self) -> bool:
         """Check if a task is currently running."""
-        return self._is_busy
+        return self._active_tasks > 0
 
     async def start_task(
         self, prompt: str, session_id: str | None = None, fork_session: bool = False
@@ -103,167 +134,154 @@ class CLISession:
         Yields:
             Event dictionaries from the CLI
         """
-        async with self._cli_lock:
-            self._is_busy = True
-            env = os.environ.copy()
-
-            if "ANTHROPIC_API_KEY" not in env:
-                env["ANTHROPIC_API_KEY"] = "sk-placeholder-key-for-proxy"
-
-            env["ANTHROPIC_API_URL"] = self.api_url
-            if self.api_url.endswith("/v1"):
-                env["ANTHROPIC_BASE_URL"] = self.api_url[:-3]
-            else:
-                env["ANTHROPIC_BASE_URL"] = self.api_url
-
-            env["TERM"] = "dumb"
-            env["PYTHONIOENCODING"] = "utf-8"
-
-            # Build command
-            if session_id and not session_id.startswith("pending_"):
-                cmd = [
-                    self.claude_bin,
-                    "--resume",
-                    session_id,
-                ]
-                if fork_session:
-                    cmd.append("--fork-session")
-                cmd += [
-                    "-p",
-                    prompt,
-                    "--output-format",
-                    "stream-json",
-                    "--dangerously-skip-permissions",
-                    "--verbose",
-                ]
-                logger.info(f"Resuming Claude session {session_id}")
-            else:
-                cmd = [
-                    self.claude_bin,
-                    "-p",
-                    prompt,
-                    "--output-format",
-                    "stream-json",
-                    "--dangerously-skip-permissions",
-                    "--verbose",
-                ]
-                logger.info("Starting new Claude session")
-
-            if self.allowed_dirs:
-                for d in self.allowed_dirs:
-                    cmd.extend(["--add-dir", d])
-
-            if self.plans_directory is not None:
-                settings_json = json.dumps({"plansDirectory": self.plans_directory})
-                cmd.extend(["--settings", settings_json])
+        # Read-only for the parent; create_subprocess_exec copies it into
+        # the child, so the precomputed dict can be passed directly.
+        env = self._base_env
+
+        # Build command
+        if session_id and not session_id.startswith("pending_"):
+            cmd = [
+                self.claude_bin,
+                "--resume",
+                session_id,
+            ]
+            if fork_session:
+                cmd.append("--fork-session")
+            cmd += ["-p", prompt, *self._static_cli_args]
+            logger.info(f"Resuming Claude session {session_id}")
+        else:
+            cmd = [self.claude_bin, "-p", prompt, *self._static_cli_args]
+            logger.info("Starting new Claude session")
+
+        # No lock around the body: all state below is task-local (the process
+        # handle, stderr task, extraction flag), so concurrent tasks on the
+        # same session — e.g. parallel forks from one parent — stream
+        # independently instead of queueing behind each other.
+        self._active_tasks += 1
+        proc: asyncio.subprocess.Process | None = None
+        try:
+            # Spawning stays on the loop deliberately: CPython's
+            # subprocess layer uses vfork/posix_spawn on Linux, so the
+            # classic fork stall under large parent RSS does not apply,
+            # and offloading to a thread would mean dropping the
+            # asyncio.subprocess API that stop()/wait()/stderr draining
+            # are built on.
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.workspace,
+                env=env,
+            )
+            self.process = proc
+            self._active_procs.add(proc)
+            if proc.pid:
+                register_pid(proc.pid)
+
+            if not proc.stdout:
+                yield {"type": "exit", "code": 1}
+                return
+
+            session_id_extracted = False
+            stderr_task: asyncio.Task[bytes] | None = None
+            if proc.stderr:
+                stderr_task = asyncio.create_task(self._drain_stderr_bounded(proc))
 
             try:
-                self.process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=self.workspace,
-                    env=env,
-                )
-                if self.process and self.process.pid:
-                    register_pid(self.process.pid)
-
-                if not self.process or not self.process.stdout:
-                    yield {"type": "exit", "code": 1}
-                    return
-
-                session_id_extracted = False
-                buffer = bytearray()
-                stderr_task: asyncio.Task[bytes] | None = None
-                if self.process.stderr:
-                    stderr_task = asyncio.create_task(
-                        self._drain_stderr_bounded(self.process)
-                    )
-
-                try:
-                    while True:
-                        chunk = await self.process.stdout.read(65536)
-                        if not chunk:
-                            if buffer:
-                                line_str = buffer.decode(
-                                    "utf-8", errors="replace"
-                                ).strip()
-                                if line_str:
-                                    async for event in self._handle_line_gen(
-                                        line_str, session_id_extracted
-                                    ):
-                                        if event.get("type") == "session_info":
-                                            session_id_extracted = True
-                                        yield event
-                            break
-
-                        buffer.extend(chunk)
-
-                        while True:
-                            newline_pos = buffer.find(b"\n")
-                            if newline_pos == -1:
-                                break
-
-                            line = buffer[:newline_pos]
-                            buffer = buffer[newline_pos + 1 :]
-
-                            line_str = line.decode("utf-8", errors="replace").strip()
-                            if line_str:
-                                async for event in self._handle_line_gen(
-                                    line_str, session_id_extracted
-                                ):
-                                    if event.get("type") == "session_info":
-                                        session_id_extracted = True
-                                    yield event
-                except asyncio.CancelledError:
-                    # Cancelling the handler task should not leave a Claude CLI
-                    # subprocess running in the background.
-                    await asyncio.shield(self.stop())
-                    raise
-                finally:
-                    stderr_bytes = b""
-                    if stderr_task is not None:
-                        stderr_bytes = await stderr_task
-
-                stderr_text = None
-                if stderr_bytes:
-                    stderr_text = stderr_bytes.decode("utf-8", errors="replace").strip()
-                    if stderr_text:
-                        if self._log_raw_cli_diagnostics:
-                            logger.error("Claude CLI stderr: {}", stderr_text)
-                        else:
-                            logger.error(
-                                "Claude CLI stderr: bytes={} text_chars={}",
-                                len(stderr_bytes),
-                                len(stderr_text),
-                            )
-                        logger.info("CLI_SESSION: Yielding error event from stderr")
-                        yield {"type": "error", "error": {"message": stderr_text}}
-
-                return_code = await self.process.wait()
-                logger.info(
-                    f"Claude CLI exited with code {return_code}, stderr_present={bool(stderr_text)}"
-                )
-                if return_code != 0 and not stderr_text:
-                    logger.warning(
-                        f"CLI_SESSION: Process exited with code {return_code} but no stderr captured"
-                    )
-                yield {
-                    "type": "exit",
-                    "code": return_code,
-                    "stderr": stderr_text,
-                }
+                async for line in self._iter_lines(proc.stdout):
+                    async for event in self._handle_line_gen(
+                        line, session_id_extracted
+                    ):
+                        if event.get("type") == "session_info":
+                            session_id_extracted = True
+                        yield event
+            except asyncio.CancelledError:
+                # Cancelling the handler task should not leave a Claude CLI
+                # subprocess running in the background. Stop only this
+                # task's process; siblings keep theirs.
+                await asyncio.shield(self._stop_proc(proc))
+                raise
             finally:
-                self._is_busy = False
-                if self.process and self.process.pid:
-                    unregister_pid(self.process.pid)
+                stderr_bytes = b""
+                if stderr_task is not None:
+                    stderr_bytes = await stderr_task
+
+            stderr_text = None
+            if stderr_bytes:
+                stderr_text = stderr_bytes.decode("utf-8", errors="replace").strip()
+                if stderr_text:
+                    if self._log_raw_cli_diagnostics:
+                        logger.error("Claude CLI stderr: {}", stderr_text)
+                    else:
+                        logger.error(
+                            "Claude CLI stderr: bytes={} text_chars={}",
+                            len(stderr_bytes),
+                            len(stderr_text),
+                        )
+                    logger.info("CLI_SESSION: Yielding error event from stderr")
+                    yield {"type": "error", "error": {"message": stderr_text}}
+
+            return_code = await proc.wait()
+            logger.info(
+                f"Claude CLI exited with code {return_code}, stderr_present={bool(stderr_text)}"
+            )
+            if return_code != 0 and not stderr_text:
+                logger.warning(
+                    f"CLI_SESSION: Process exited with code {return_code} but no stderr captured"
+                )
+            yield {
+                "type": "exit",
+                "code": return_code,
+                "stderr": stderr_text,
+            }
+        finally:
+            self._active_tasks -= 1
+            if proc is not None:
+                self._active_procs.discard(proc)
+                if proc.pid:
+                    unregister_pid(proc.pid)
+
+    @staticmethod
+    async def _iter_lines(stdout: asyncio.StreamReader) -> AsyncGenerator[bytes]:
+        """Yield complete non-blank stdout lines as raw bytes.
+
+        Reads in 64KB chunks and splits on newlines locally, keeping the
+        business logic in :meth:`start_task` a thin consumer.
+        """
+        buffer = bytearray()
+        while True:
+            chunk = await stdout.read(65536)
+            if not chunk:
+                # Blank detection via isspace(): strip() would allocate a
+                # copy of every line just to test it, and orjson tolerates
+                # surrounding whitespace anyway.
+                if buffer and not buffer.isspace():
+                    yield bytes(buffer)
+                return
+
+            buffer.extend(chunk)
+
+            while True:
+                newline_pos = buffer.find(b"\n")
+                if newline_pos == -1:
+                    break
+
+                line = buffer[:newline_pos]
+                buffer = buffer[newline_pos + 1 :]
+
+                if line and not line.isspace():
+                    yield bytes(line)
 
     async def _handle_line_gen(
-        self, line_str: str, session_id_extracted: bool
+        self, line: bytes, session_id_extracted: bool
     ) -> AsyncGenerator[dict]:
-        """Process a single line and yield events."""
+        """Parse a single stdout line (raw bytes) and yield events.
+
+        orjson parses the bytes directly — no per-line decode/strip on the
+        streaming hot path; decoding happens only for the non-JSON fallback.
+        """
         try:
-            event = json.loads(line_str)
+            event = orjson.loads(line)
             if not session_id_extracted:
                 extracted_id = self._extract_session_id(event)
                 if extracted_id:
@@ -272,7 +290,8 @@ class CLISession:
                     yield {"type": "session_info", "session_id": extracted_id}
 
             yield event
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
+            line_str = line.decode("utf-8", errors="replace").strip()
             if self._log_raw_cli_diagnostics:
                 logger.debug("Non-JSON output: {}", line_str)
             else:
@@ -280,55 +299,66 @@ class CLISession:
             yield {"type": "raw", "content": line_str}
 
     def _extract_session_id(self, event: Any) -> str | None:
-        """Extract session ID from CLI event."""
+        """Extract session ID from CLI event.
+
+        Runs for every streamed event until an ID is found, so probes are
+        kept to single .get() calls per candidate location.
+        """
         if not isinstance(event, dict):
             return None
 
-        if "session_id" in event:
-            return event["session_id"]
-        if "sessionId" in event:
-            return event["sessionId"]
+        sid = event.get("session_id") or event.get("sessionId")
+        if sid:
+            return sid
 
-        for key in ["init", "system", "result", "metadata"]:
-            if key in event and isinstance(event[key], dict):
-                nested = event[key]
-                if "session_id" in nested:
-                    return nested["session_id"]
-                if "sessionId" in nested:
-                    return nested["sessionId"]
+        for key in _NESTED_SESSION_KEYS:
+            nested = event.get(key)
+            if isinstance(nested, dict):
+                sid = nested.get("session_id") or nested.get("sessionId")
+                if sid:
+                    return sid
 
-        if "conversation" in event and isinstance(event["conversation"], dict):
-            conv = event["conversation"]
-            if "id" in conv:
-                return conv["id"]
+        conv = event.get("conversation")
+        if isinstance(conv, dict) and "id" in conv:
+            return conv["id"]
 
         return None
 
-    async def stop(self):
-        """Stop the CLI process."""
-        if self.process and self.process.returncode is None:
+    async def _stop_proc(self, proc: asyncio.subprocess.Process) -> bool:
+        """Terminate one CLI process, escalating to kill after a grace period."""
+        if proc.returncode is not None:
+            return False
+        try:
+            logger.info(f"Stopping Claude CLI process {proc.pid}")
+            proc.terminate()
             try:
-                logger.info(f"Stopping Claude CLI process {self.process.pid}")
-                self.process.terminate()
-                try:
-                    await asyncio.wait_for(self.process.wait(), timeout=5.0)
-                except TimeoutError:
-                    self.process.kill()
-                    await self.process.wait()
-                if self.process and self.process.pid:
-                    unregister_pid(self.process.pid)
-                return True
-            except Exception as e:
-                if self._log_raw_cli_diagnostics:
-                    logger.error(
-                        "Error stopping process: {}: {}",
-                        type(e).__name__,
-                        e,
-                    )
-                else:
-                    logger.error(
-                        "Error stopping process: exc_type={}",
-                        type(e).__name__,
-                    )
-                return False
-        return False
+                await asyncio.wait_for(proc.wait(), timeout=5.0)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+            if proc.pid:
+                unregister_pid(proc.pid)
+            return True
+        except Exception as e:
+            if self._log_raw_cli_diagnostics:
+                logger.error(
+                    "Error stopping process: {}: {}",
+                    type(e).__name__,
+                    e,
+                )
+            else:
+                logger.error(
+                    "Error stopping process: exc_type={}",
+                    type(e).__name__,
+                )
+            return False
+
+    async def stop(self):
+        """Stop every CLI process this session currently owns."""
+        procs = list(self._active_procs)
+        if self.process is not None and self.process not in self._active_procs:
+            procs.append(self.process)
+        stopped = False
+        for proc in procs:
+            stopped = await self._stop_proc(proc) or stopped
+        return stopped
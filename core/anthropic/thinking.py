@@ -1,5 +1,6 @@
 """Streaming parser for provider-emitted thinking tags."""
 
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
@@ -29,6 +30,10 @@ class ThinkTagParser:
 
     OPEN_TAG = "<think>"
     CLOSE_TAG = "</think>"
+    # Matches whichever tag appears first in one pass; feed() runs per
+    # streamed delta, so this replaces two full-buffer substring searches
+    # per iteration with a single scan.
+    _TAG_RE = re.compile(r"</?think>")
 
     def __init__(self):
         self._buffer: str = ""
@@ -57,17 +62,17 @@ class ThinkTagParser:
 
     def _parse_outside_think(self) -> ContentChunk | None:
         """Parse content outside think tags."""
-        think_start = self._buffer.find(self.OPEN_TAG)
-        orphan_close = self._buffer.find(self.CLOSE_TAG)
+        match = self._TAG_RE.search(self._buffer)
 
-        if orphan_close != -1 and (think_start == -1 or orphan_close < think_start):
-            pre_orphan = self._buffer[:orphan_close]
-            self._buffer = self._buffer[orphan_close + len(self.CLOSE_TAG) :]
+        if match is not None and match.group() == self.CLOSE_TAG:
+            # Orphan close tag before any open: drop it.
+            pre_orphan = self._buffer[: match.start()]
+            self._buffer = self._buffer[match.end() :]
             if pre_orphan:
                 return ContentChunk(ContentType.TEXT, pre_orphan)
             return None
 
-        if think_start == -1:
+        if match is None:
             last_bracket = self._buffer.rfind("<")
             if last_bracket != -1:
                 potential_tag = self._buffer[last_bracket:]
@@ -91,8 +96,8 @@ class ThinkTagParser:
                 return ContentChunk(ContentType.TEXT, emit)
             return None
 
-        pre_think = self._buffer[:think_start]
-        self._buffer = self._buffer[think_start + len(self.OPEN_TAG) :]
+        pre_think = self._buffer[: match.start()]
+        self._buffer = self._buffer[match.end() :]
         self._in_think_tag = True
         if pre_think:
             return ContentChunk(ContentType.TEXT, pre_think)
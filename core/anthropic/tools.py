@@ -35,6 +35,7 @@ class HeuristicToolParser:
     _WEB_TOOL_JSON_PATTERN = re.compile(
         r"(?is)\b(?:use\s+)?(?P<tool>WebFetch|WebSearch)\b.*?(?P<json>\{.*?\})"
     )
+    _PARTIAL_PARAM_PATTERN = re.compile(r"<parameter=([^>]+)>(.*)$", re.DOTALL)
 
     def __init__(self):
         self._state = ParserState.TEXT
@@ -102,8 +103,8 @@ class HeuristicToolParser:
 
         while True:
             if self._state == ParserState.TEXT:
-                if "●" in self._buffer:
-                    idx = self._buffer.find("●")
+                idx = self._buffer.find("●")
+                if idx != -1:
                     filtered_output_parts.append(self._buffer[:idx])
                     self._buffer = self._buffer[idx:]
                     self._state = ParserState.MATCHING_FUNCTION
@@ -141,7 +142,7 @@ class HeuristicToolParser:
 
                 while True:
                     param_match = self._PARAM_PATTERN.search(self._buffer)
-                    if param_match and "</parameter>" in param_match.group(0):
+                    if param_match and param_match.group(0).endswith("</parameter>"):
                         pre_match_text = self._buffer[: param_match.start()]
                         if pre_match_text:
                             filtered_output_parts.append(pre_match_text)
@@ -153,8 +154,8 @@ class HeuristicToolParser:
                     else:
                         break
 
-                if "●" in self._buffer:
-                    idx = self._buffer.find("●")
+                idx = self._buffer.find("●")
+                if idx != -1:
                     if idx > 0:
                         filtered_output_parts.append(self._buffer[:idx])
                         self._buffer = self._buffer[idx:]
@@ -190,9 +191,7 @@ class HeuristicToolParser:
         self._buffer = self._strip_control_tokens(self._buffer)
         detected_tools = []
         if self._state == ParserState.PARSING_PARAMETERS:
-            partial_matches = re.finditer(
-                r"<parameter=([^>]+)>(.*)$", self._buffer, re.DOTALL
-            )
+            partial_matches = self._PARTIAL_PARAM_PATTERN.finditer(self._buffer)
             for match in partial_matches:
                 key = match.group(1).strip()
                 val = match.group(2).strip()
@@ -0,0 +1,46 @@
+"""Shared bounded LRU cache primitive."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+
+class BoundedLRUCache:
+    """Dict-like cache bounded to ``maxsize`` entries with LRU eviction.
+
+    Lookups refresh recency; inserting beyond capacity evicts the least
+    recently used entry. Keeps long-running processes at a predictable RSS
+    where an unbounded dict would grow forever.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self._maxsize = int(maxsize)
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value (refreshing recency) or ``default``."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        """Insert or update ``key``, evicting the LRU entry when full."""
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = value
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -2,7 +2,7 @@
 Global Rate Limiter for Messaging Platforms.
 
 Centralizes outgoing message requests and ensures compliance with rate limits
-using a strict sliding window algorithm and a task queue.
+using a paced token bucket and a task queue.
 """
 
 import asyncio
@@ -13,7 +13,6 @@ from typing import Any
 from loguru import logger
 
 from config.settings import get_settings
-from core.rate_limit import StrictSlidingWindowLimiter as SlidingWindowLimiter
 
 from .safe_diagnostics import format_exception_for_log
 
@@ -29,6 +28,17 @@ class MessagingRateLimiter:
     _instance: MessagingRateLimiter | None = None
     _lock = asyncio.Lock()
 
+    # Adaptive token bucket tuning (see record_flood / _record_success).
+    _FLOOD_BACKOFF_FACTOR = 2.0
+    _RECOVERY_STEP = 0.1  # fractional rate increase per recovery interval
+    _RECOVERY_INTERVAL = 8  # consecutive successes between recovery steps
+    _MIN_RATE_FRACTION = 0.125  # floor relative to the configured rate
+
+    # Declared here because __init__ returns early on singleton re-init
+    # before assigning them, while record_flood/_record_success read them.
+    _min_rate: float
+    _max_rate: float
+
     def __new__(cls, *args, **kwargs):
         return super().__new__(cls)
 
@@ -56,11 +66,31 @@ class MessagingRateLimiter:
         if hasattr(self, "_initialized"):
             return
 
-        self.limiter = SlidingWindowLimiter(rate_limit, rate_window)
+        if rate_limit <= 0:
+            raise ValueError("rate_limit must be > 0")
+        if rate_window <= 0:
+            raise ValueError("rate_window must be > 0")
+
+        self._rate_limit = int(rate_limit)
+        self._rate_window = float(rate_window)
+        # Token bucket state: refilled inline on each acquire, no separate
+        # timer task. Capacity is a single token so emission stays evenly
+        # paced at rate_limit/rate_window, which preserves the strict
+        # at-most-rate_limit-per-window guarantee.
+        self._rate = self._rate_limit / self._rate_window
+        self._tokens = 1.0
+        self._last = asyncio.get_event_loop().time()
+        # Adaptive rate bounds: flood signals back the rate off
+        # multiplicatively; sustained successes recover it toward the
+        # configured ceiling.
+        self._max_rate = self._rate
+        self._min_rate = self._rate * self._MIN_RATE_FRACTION
+        self._success_streak = 0
         # Custom queue state - using deque for O(1) popleft
         self._queue_list: deque[str] = deque()  # Deque of dedup_keys in order
         self._queue_map: dict[
-            str, tuple[Callable[[], Awaitable[Any]], list[asyncio.Future]]
+            str,
+            tuple[Callable[..., Awaitable[Any]], tuple[Any, ...], list[asyncio.Future]],
         ] = {}
         self._condition = asyncio.Condition()
         self._shutdown = asyncio.Event()
@@ -73,6 +103,54 @@ class MessagingRateLimiter:
             f"MessagingRateLimiter initialized ({rate_limit} req / {rate_window}s with Task Compaction)"
         )
 
+    async def _acquire_token(self) -> None:
+        """Wait until a token is available, then consume it.
+
+        Refills the bucket from elapsed loop time and sleeps exactly the
+        remaining deficit — a single analytically computed sleep instead of
+        a lock/retry loop.
+        """
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+        self._tokens = min(1.0, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+        if self._tokens < 1.0:
+            await asyncio.sleep((1.0 - self._tokens) / self._rate)
+            self._last = loop.time()
+            self._tokens = 1.0
+        self._tokens -= 1.0
+
+    def record_flood(self, seconds: float | None = None) -> None:
+        """Back off the emission rate after a platform flood/rate-limit signal.
+
+        Platforms call this when the API explicitly asks to slow down (e.g.
+        Telegram ``RetryAfter``) even if the triggering call is retried
+        internally. ``seconds`` additionally pauses the worker for the wait
+        the platform requested.
+        """
+        old_rate = self._rate
+        self._rate = max(self._min_rate, self._rate / self._FLOOD_BACKOFF_FACTOR)
+        self._success_streak = 0
+        if seconds:
+            self._paused_until = max(
+                self._paused_until,
+                asyncio.get_event_loop().time() + float(seconds),
+            )
+        logger.warning(
+            "MessagingRateLimiter flood backoff: rate {:.3f} -> {:.3f} req/s",
+            old_rate,
+            self._rate,
+        )
+
+    def _record_success(self) -> None:
+        """Recover the emission rate after sustained successful sends."""
+        if self._rate >= self._max_rate:
+            return
+        self._success_streak += 1
+        if self._success_streak >= self._RECOVERY_INTERVAL:
+            self._success_streak = 0
+            self._rate = min(self._max_rate, self._rate * (1 + self._RECOVERY_STEP))
+
     def _start_worker(self) -> None:
         """Ensure the worker task exists."""
         if self._worker_task and not self._worker_task.done():
@@ -96,7 +174,7 @@ class MessagingRateLimiter:
                         break
 
                     dedup_key = self._queue_list.popleft()
-                    func, futures = self._queue_map.pop(dedup_key)
+                    func, args, futures = self._queue_map.pop(dedup_key)
 
                 # Check for manual pause (FloodWait)
                 now = asyncio.get_event_loop().time()
@@ -108,50 +186,60 @@ class MessagingRateLimiter:
                     await asyncio.sleep(wait_time)
 
                 # Wait for rate limit capacity
-                async with self.limiter:
-                    try:
-                        result = await func()
-                        for f in futures:
-                            if not f.done():
-                                f.set_result(result)
-                    except Exception as e:
-                        # Report error to all futures and log it
-                        for f in futures:
-                            if not f.done():
-                                f.set_exception(e)
-
-                        error_msg = str(e).lower()
-                        if "flood" in error_msg or "wait" in error_msg:
-                            seconds = 30
-                            try:
-                                if hasattr(e, "seconds"):
-                                    seconds = e.seconds
-                                elif "after " in error_msg:
-                                    # Try to parse "retry after X"
-                                    parts = error_msg.split("after ")
-                                    if len(parts) > 1:
-                                        seconds = int(parts[1].split()[0])
-                            except Exception:
-                                pass
-
-                            logger.error(
-                                f"FloodWait detected! Pausing worker for {seconds}s"
-                            )
-                            wait_secs = (
-                                float(seconds)
-                                if isinstance(seconds, (int, float, str))
-                                else 30.0
-                            )
-                            self._paused_until = (
-                                asyncio.get_event_loop().time() + wait_secs
-                            )
-                        else:
-                            d = get_settings().log_messaging_error_details
-                            logger.error(
-                                "Error in limiter worker for key {}: {}",
-                                dedup_key,
-                                format_exception_for_log(e, log_full_message=d),
-                            )
+                await self._acquire_token()
+
+                # A newer version of this task may have been compacted into
+                # the queue while we waited for a token; execute the latest
+                # one and fold its futures in so only the freshest edit is
+                # actually sent.
+                async with self._condition:
+                    if dedup_key in self._queue_map:
+                        func, args, newer_futures = self._queue_map.pop(dedup_key)
+                        self._queue_list.remove(dedup_key)
+                        futures.extend(newer_futures)
+
+                try:
+                    result = await func(*args)
+                    self._record_success()
+                    for f in futures:
+                        if not f.done():
+                            f.set_result(result)
+                except Exception as e:
+                    # Report error to all futures and log it
+                    for f in futures:
+                        if not f.done():
+                            f.set_exception(e)
+
+                    error_msg = str(e).lower()
+                    if "flood" in error_msg or "wait" in error_msg:
+                        seconds = 30
+                        try:
+                            if hasattr(e, "seconds"):
+                                seconds = e.seconds
+                            elif "after " in error_msg:
+                                # Try to parse "retry after X"
+                                parts = error_msg.split("after ")
+                                if len(parts) > 1:
+                                    seconds = int(parts[1].split()[0])
+                        except Exception:
+                            pass
+
+                        logger.error(
+                            f"FloodWait detected! Pausing worker for {seconds}s"
+                        )
+                        wait_secs = (
+                            float(seconds)
+                            if isinstance(seconds, (int, float, str))
+                            else 30.0
+                        )
+                        self.record_flood(wait_secs)
+                    else:
+                        d = get_settings().log_messaging_error_details
+                        logger.error(
+                            "Error in limiter worker for key {}: {}",
+                            dedup_key,
+                            format_exception_for_log(e, log_full_message=d),
+                        )
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -211,21 +299,23 @@ class MessagingRateLimiter:
         finally:
             cls._instance = None
 
-    async def _enqueue_internal(self, func, future, dedup_key, front=False):
-        await self._enqueue_internal_multi(func, [future], dedup_key, front)
+    async def _enqueue_internal(self, func, args, future, dedup_key, front=False):
+        await self._enqueue_internal_multi(func, args, [future], dedup_key, front)
 
-    async def _enqueue_internal_multi(self, func, futures, dedup_key, front=False):
+    async def _enqueue_internal_multi(
+        self, func, args, futures, dedup_key, front=False
+    ):
         async with self._condition:
             if dedup_key in self._queue_map:
-                # Compaction: Update existing task with new func, append new futures
-                _old_func, old_futures = self._queue_map[dedup_key]
+                # Compaction: Update existing task with new call, append new futures
+                _old_func, _old_args, old_futures = self._queue_map[dedup_key]
                 old_futures.extend(futures)
-                self._queue_map[dedup_key] = (func, old_futures)
+                self._queue_map[dedup_key] = (func, args, old_futures)
                 logger.debug(
                     f"Compacted task for key: {dedup_key} (now {len(old_futures)} futures)"
                 )
             else:
-                self._queue_map[dedup_key] = (func, futures)
+                self._queue_map[dedup_key] = (func, args, futures)
                 if front:
                     self._queue_list.appendleft(dedup_key)
                 else:
@@ -233,10 +323,17 @@ class MessagingRateLimiter:
                 self._condition.notify_all()
 
     async def enqueue(
-        self, func: Callable[[], Awaitable[Any]], dedup_key: str | None = None
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        dedup_key: str | None = None,
     ) -> Any:
         """
         Enqueue a messaging task and return its future result.
+
+        ``func`` is called with ``*args`` on the worker, so call sites can
+        pass a bound method and its arguments directly instead of building
+        a closure per call.
         If dedup_key is provided, subsequent tasks with the same key will replace this one.
         """
         if dedup_key is None:
@@ -244,11 +341,14 @@ class MessagingRateLimiter:
             dedup_key = f"task_{id(func)}_{asyncio.get_event_loop().time()}"
 
         future = asyncio.get_event_loop().create_future()
-        await self._enqueue_internal(func, future, dedup_key)
+        await self._enqueue_internal(func, args, future, dedup_key)
         return await future
 
     def fire_and_forget(
-        self, func: Callable[[], Awaitable[Any]], dedup_key: str | None = None
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        dedup_key: str | None = None,
     ):
         """Enqueue a task without waiting for the result."""
         if dedup_key is None:
@@ -260,7 +360,7 @@ class MessagingRateLimiter:
             max_retries = 2
             for attempt in range(max_retries + 1):
                 try:
-                    return await self.enqueue(func, dedup_key)
+                    return await self.enqueue(func, *args, dedup_key=dedup_key)
                 except Exception as e:
                     error_msg = str(e).lower()
                     # Only retry transient connectivity issues that might have slipped through
@@ -1,5 +1,7 @@
 """Abstract base class for messaging platforms."""
 
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import (
@@ -8,6 +10,8 @@ from typing import (
     runtime_checkable,
 )
 
+from loguru import logger
+
 from ..models import IncomingMessage
 
 
@@ -219,10 +223,93 @@ class MessagingPlatform(ABC):
         """
         pass
 
-    @abstractmethod
+    # Bounded pool for fire-and-forget work: caps concurrent outgoing API
+    # calls and the number of pending tasks the loop scheduler must track
+    # under streaming bursts.
+    _SEND_QUEUE_MAXSIZE = 256
+    _SEND_WORKER_COUNT = 4
+
+    _send_queue: asyncio.Queue | None = None
+    _send_worker_tasks: list[asyncio.Task] | None = None
+
     def fire_and_forget(self, task: Awaitable[Any]) -> None:
-        """Execute a coroutine without awaiting it."""
-        pass
+        """Execute a coroutine without awaiting it.
+
+        Tasks are drained by a small shared worker pool instead of spawning
+        one loop task per call. On overflow (or without a running loop) the
+        task degrades to an unbounded ``ensure_future`` so nothing is lost.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.ensure_future(task)
+            return
+
+        queue = self._send_queue
+        if queue is None:
+            queue = self._send_queue = asyncio.Queue(maxsize=self._SEND_QUEUE_MAXSIZE)
+            self._send_worker_tasks = [
+                loop.create_task(
+                    self._send_worker(queue), name=f"{self.name}-send-worker-{i}"
+                )
+                for i in range(self._SEND_WORKER_COUNT)
+            ]
+
+        try:
+            queue.put_nowait(task)
+        except asyncio.QueueFull:
+            logger.warning(
+                "{} fire_and_forget queue full ({} pending); executing task unbounded",
+                self.name,
+                queue.qsize(),
+            )
+            asyncio.ensure_future(task)
+
+    async def _send_worker(self, queue: asyncio.Queue) -> None:
+        """Drain fire-and-forget tasks; failures are logged, never raised."""
+        while True:
+            task = await queue.get()
+            try:
+                await task
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "fire_and_forget task failed: exc_type={}", type(e).__name__
+                )
+            finally:
+                queue.task_done()
+
+    async def shutdown_send_workers(self) -> None:
+        """Cancel the fire-and-forget worker pool (safe to call repeatedly)."""
+        tasks = self._send_worker_tasks
+        queue = self._send_queue
+        self._send_worker_tasks = None
+        self._send_queue = None
+        if tasks:
+            for t in tasks:
+                t.cancel()
+            for t in tasks:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await t
+        if queue is None:
+            return
+        # Close whatever the workers never got to, so dropped sends don't
+        # surface as "coroutine was never awaited" warnings.
+        dropped = 0
+        while True:
+            try:
+                task = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if asyncio.iscoroutine(task):
+                task.close()
+            dropped += 1
+            queue.task_done()
+        if dropped:
+            logger.warning(
+                "{} fire_and_forget tasks dropped at shutdown: {}", self.name, dropped
+            )
 
     @property
     def is_connected(self) -> bool:
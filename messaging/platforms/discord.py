@@ -393,6 +393,7 @@ class DiscordPlatform(MessagingPlatform):
 
     async def stop(self) -> None:
         """Stop the bot."""
+        await self.shutdown_send_workers()
         if self._client.is_closed():
             self._connected = False
             return
@@ -497,15 +498,19 @@ class DiscordPlatform(MessagingPlatform):
                 chat_id, text, reply_to, parse_mode, message_thread_id
             )
 
-        async def _send():
-            return await self.send_message(
-                chat_id, text, reply_to, parse_mode, message_thread_id
-            )
-
         if fire_and_forget:
-            self._limiter.fire_and_forget(_send)
+            self._limiter.fire_and_forget(
+                self.send_message,
+                chat_id,
+                text,
+                reply_to,
+                parse_mode,
+                message_thread_id,
+            )
             return None
-        return await self._limiter.enqueue(_send)
+        return await self._limiter.enqueue(
+            self.send_message, chat_id, text, reply_to, parse_mode, message_thread_id
+        )
 
     async def queue_edit_message(
         self,
@@ -520,14 +525,25 @@ class DiscordPlatform(MessagingPlatform):
             await self.edit_message(chat_id, message_id, text, parse_mode)
             return
 
-        async def _edit():
-            await self.edit_message(chat_id, message_id, text, parse_mode)
-
         dedup_key = f"edit:{chat_id}:{message_id}"
         if fire_and_forget:
-            self._limiter.fire_and_forget(_edit, dedup_key=dedup_key)
+            self._limiter.fire_and_forget(
+                self.edit_message,
+                chat_id,
+                message_id,
+                text,
+                parse_mode,
+                dedup_key=dedup_key,
+            )
         else:
-            await self._limiter.enqueue(_edit, dedup_key=dedup_key)
+            await self._limiter.enqueue(
+                self.edit_message,
+                chat_id,
+                message_id,
+                text,
+                parse_mode,
+                dedup_key=dedup_key,
+            )
 
     async def queue_delete_message(
         self,
@@ -540,14 +556,15 @@ class DiscordPlatform(MessagingPlatform):
             await self.delete_message(chat_id, message_id)
             return
 
-        async def _delete():
-            await self.delete_message(chat_id, message_id)
-
         dedup_key = f"del:{chat_id}:{message_id}"
         if fire_and_forget:
-            self._limiter.fire_and_forget(_delete, dedup_key=dedup_key)
+            self._limiter.fire_and_forget(
+                self.delete_message, chat_id, message_id, dedup_key=dedup_key
+            )
         else:
-            await self._limiter.enqueue(_delete, dedup_key=dedup_key)
+            await self._limiter.enqueue(
+                self.delete_message, chat_id, message_id, dedup_key=dedup_key
+            )
 
     async def queue_delete_messages(
         self,
@@ -563,21 +580,15 @@ class DiscordPlatform(MessagingPlatform):
             await self.delete_messages(chat_id, message_ids)
             return
 
-        async def _bulk():
-            await self.delete_messages(chat_id, message_ids)
-
         dedup_key = f"del_bulk:{chat_id}:{hash(tuple(message_ids))}"
         if fire_and_forget:
-            self._limiter.fire_and_forget(_bulk, dedup_key=dedup_key)
-        else:
-            await self._limiter.enqueue(_bulk, dedup_key=dedup_key)
-
-    def fire_and_forget(self, task: Awaitable[Any]) -> None:
-        """Execute a coroutine without awaiting it."""
-        if asyncio.iscoroutine(task):
-            _ = asyncio.create_task(task)
+            self._limiter.fire_and_forget(
+                self.delete_messages, chat_id, message_ids, dedup_key=dedup_key
+            )
         else:
-            _ = asyncio.ensure_future(task)
+            await self._limiter.enqueue(
+                self.delete_messages, chat_id, message_ids, dedup_key=dedup_key
+            )
 
     def on_message(
         self,
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from core.anthropic import format_user_error_preview
+from core.lru import BoundedLRUCache
 
 if TYPE_CHECKING:
     from telegram import Update
@@ -80,6 +81,13 @@ class TelegramPlatform(MessagingPlatform):
 
         self.bot_token = bot_token
         self.allowed_user_id = allowed_user_id
+        # Normalized once here; the security check runs per incoming update.
+        # Gating below stays on the raw value so a whitespace-only id still
+        # fails closed (empty norm matches no sender) instead of disabling
+        # the check.
+        self._allowed_user_id_norm: str = (
+            str(allowed_user_id).strip() if allowed_user_id else ""
+        )
 
         if not self.bot_token:
             # We don't raise here to allow instantiation for testing/conditional logic,
@@ -92,6 +100,11 @@ class TelegramPlatform(MessagingPlatform):
         )
         self._connected = False
         self._limiter: Any | None = None  # Will be MessagingRateLimiter
+        # Last-sent content hash per (chat_id, message_id): streaming flushes
+        # fire on a timer whether or not the text changed, and each no-op
+        # edit would otherwise still cost a round-trip and a limiter token
+        # before Telegram answers "message is not modified".
+        self._last_edit_hash: BoundedLRUCache = BoundedLRUCache(maxsize=512)
         # Pending voice transcriptions: (chat_id, msg_id) -> (voice_msg_id, status_msg_id)
         self._pending_voice = PendingVoiceRegistry()
         self._voice_transcription = VoiceTranscriptionService(
@@ -210,6 +223,7 @@ class TelegramPlatform(MessagingPlatform):
 
     async def stop(self) -> None:
         """Stop the bot."""
+        await self.shutdown_send_workers()
         if self._application and self._application.updater:
             await self._application.updater.stop()
             await self._application.stop()
@@ -251,6 +265,10 @@ class TelegramPlatform(MessagingPlatform):
                     wait_secs = float(retry_after)
 
                 logger.warning(f"Rate limited by Telegram, waiting {wait_secs}s...")
+                # Let the limiter adapt its emission rate even though this
+                # call is retried internally (the wait itself is served here).
+                if self._limiter:
+                    self._limiter.record_flood()
                 await asyncio.sleep(wait_secs)
                 # We don't increment attempt here, as this is a specific instruction
                 return await func(*args, **kwargs)
@@ -303,7 +321,10 @@ class TelegramPlatform(MessagingPlatform):
             msg = await bot.send_message(**kwargs)
             return str(msg.message_id)
 
-        return await self._with_retry(_do_send, parse_mode=parse_mode)
+        message_id = await self._with_retry(_do_send, parse_mode=parse_mode)
+        if message_id is not None:
+            self._last_edit_hash.put((chat_id, message_id), hash((text, parse_mode)))
+        return message_id
 
     async def edit_message(
         self,
@@ -317,6 +338,16 @@ class TelegramPlatform(MessagingPlatform):
         if not app or not app.bot:
             raise RuntimeError("Telegram application or bot not initialized")
 
+        key = (chat_id, message_id)
+        content_hash = hash((text, parse_mode))
+        if self._last_edit_hash.get(key) == content_hash:
+            logger.debug(
+                "Skipping no-op edit for chat_id={} message_id={}",
+                chat_id,
+                message_id,
+            )
+            return
+
         async def _do_edit(parse_mode=parse_mode):
             bot = app.bot
             await bot.edit_message_text(
@@ -327,6 +358,7 @@ class TelegramPlatform(MessagingPlatform):
             )
 
         await self._with_retry(_do_edit, parse_mode=parse_mode)
+        self._last_edit_hash.put(key, content_hash)
 
     async def delete_message(
         self,
@@ -390,16 +422,25 @@ class TelegramPlatform(MessagingPlatform):
                 chat_id, text, reply_to, parse_mode, message_thread_id
             )
 
-        async def _send():
-            return await self.send_message(
-                chat_id, text, reply_to, parse_mode, message_thread_id
-            )
-
         if fire_and_forget:
-            self._limiter.fire_and_forget(_send)
+            self._limiter.fire_and_forget(
+                self.send_message,
+                chat_id,
+                text,
+                reply_to,
+                parse_mode,
+                message_thread_id,
+            )
             return None
         else:
-            return await self._limiter.enqueue(_send)
+            return await self._limiter.enqueue(
+                self.send_message,
+                chat_id,
+                text,
+                reply_to,
+                parse_mode,
+                message_thread_id,
+            )
 
     async def queue_edit_message(
         self,
@@ -413,14 +454,25 @@ class TelegramPlatform(MessagingPlatform):
         if not self._limiter:
             return await self.edit_message(chat_id, message_id, text, parse_mode)
 
-        async def _edit():
-            return await self.edit_message(chat_id, message_id, text, parse_mode)
-
         dedup_key = f"edit:{chat_id}:{message_id}"
         if fire_and_forget:
-            self._limiter.fire_and_forget(_edit, dedup_key=dedup_key)
+            self._limiter.fire_and_forget(
+                self.edit_message,
+                chat_id,
+                message_id,
+                text,
+                parse_mode,
+                dedup_key=dedup_key,
+            )
         else:
-            await self._limiter.enqueue(_edit, dedup_key=dedup_key)
+            await self._limiter.enqueue(
+                self.edit_message,
+                chat_id,
+                message_id,
+                text,
+                parse_mode,
+                dedup_key=dedup_key,
+            )
 
     async def queue_delete_message(
         self,
@@ -432,14 +484,15 @@ class TelegramPlatform(MessagingPlatform):
         if not self._limiter:
             return await self.delete_message(chat_id, message_id)
 
-        async def _delete():
-            return await self.delete_message(chat_id, message_id)
-
         dedup_key = f"del:{chat_id}:{message_id}"
         if fire_and_forget:
-            self._limiter.fire_and_forget(_delete, dedup_key=dedup_key)
+            self._limiter.fire_and_forget(
+                self.delete_message, chat_id, message_id, dedup_key=dedup_key
+            )
         else:
-            await self._limiter.enqueue(_delete, dedup_key=dedup_key)
+            await self._limiter.enqueue(
+                self.delete_message, chat_id, message_id, dedup_key=dedup_key
+            )
 
     async def queue_delete_messages(
         self,
@@ -454,22 +507,16 @@ class TelegramPlatform(MessagingPlatform):
         if not self._limiter:
             return await self.delete_messages(chat_id, message_ids)
 
-        async def _bulk():
-            return await self.delete_messages(chat_id, message_ids)
-
         # Dedup by the chunk content; okay to be coarse here.
         dedup_key = f"del_bulk:{chat_id}:{hash(tuple(message_ids))}"
         if fire_and_forget:
-            self._limiter.fire_and_forget(_bulk, dedup_key=dedup_key)
-        else:
-            await self._limiter.enqueue(_bulk, dedup_key=dedup_key)
-
-    def fire_and_forget(self, task: Awaitable[Any]) -> None:
-        """Execute a coroutine without awaiting it."""
-        if asyncio.iscoroutine(task):
-            _ = asyncio.create_task(task)
+            self._limiter.fire_and_forget(
+                self.delete_messages, chat_id, message_ids, dedup_key=dedup_key
+            )
         else:
-            _ = asyncio.ensure_future(task)
+            await self._limiter.enqueue(
+                self.delete_messages, chat_id, message_ids, dedup_key=dedup_key
+            )
 
     def on_message(
         self,
@@ -508,7 +555,7 @@ class TelegramPlatform(MessagingPlatform):
         chat_id = str(update.effective_chat.id)
 
         # Security check
-        if self.allowed_user_id and user_id != str(self.allowed_user_id).strip():
+        if self.allowed_user_id and user_id != self._allowed_user_id_norm:
             logger.warning(f"Unauthorized access attempt from {user_id}")
             return
 
@@ -593,7 +640,7 @@ class TelegramPlatform(MessagingPlatform):
         user_id = str(update.effective_user.id)
         chat_id = str(update.effective_chat.id)
 
-        if self.allowed_user_id and user_id != str(self.allowed_user_id).strip():
+        if self.allowed_user_id and user_id != self._allowed_user_id_norm:
             logger.warning(f"Unauthorized voice access attempt from {user_id}")
             return
 
@@ -10,6 +10,7 @@ from typing import Any
 
 from loguru import logger
 
+from core.lru import BoundedLRUCache
 from providers.nvidia_nim.voice import (
     transcribe_audio_file as transcribe_nvidia_nim_audio,
 )
@@ -28,8 +29,10 @@ _MODEL_MAP: dict[str, str] = {
     "large-v3-turbo": "openai/whisper-large-v3-turbo",
 }
 
-# Lazy-loaded pipelines: (model_id, device, hf_token_fingerprint) -> pipeline
-_pipeline_cache: dict[tuple[str, str, str], Any] = {}
+# Lazy-loaded pipelines: (model_id, device, hf_token_fingerprint) -> pipeline.
+# Bounded so switching models in a long-running bot releases old pipelines
+# (each holds an entire model in memory) instead of accumulating forever.
+_pipeline_cache: BoundedLRUCache = BoundedLRUCache(maxsize=2)
 
 
 def _resolve_model_id(whisper_model: str) -> str:
@@ -39,12 +42,12 @@ def _resolve_model_id(whisper_model: str) -> str:
 
 def _get_pipeline(model_id: str, device: str, hf_token: str = "") -> Any:
     """Lazy-load transformers Whisper pipeline. Raises ImportError if not installed."""
-    global _pipeline_cache
     if device not in ("cpu", "cuda"):
         raise ValueError(f"whisper_device must be 'cpu' or 'cuda', got {device!r}")
     resolved_token = hf_token or ""
     cache_key = (model_id, device, resolved_token)
-    if cache_key not in _pipeline_cache:
+    cached = _pipeline_cache.get(cache_key)
+    if cached is None:
         try:
             import torch
             from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
@@ -72,7 +75,8 @@ def _get_pipeline(model_id: str, device: str, hf_token: str = "") -> Any:
                 feature_extractor=processor.feature_extractor,
                 device=pipe_device,
             )
-            _pipeline_cache[cache_key] = pipe
+            _pipeline_cache.put(cache_key, pipe)
+            cached = pipe
             logger.debug(
                 f"Loaded Whisper pipeline: model={model_id} device={pipe_device}"
             )
@@ -80,7 +84,7 @@ def _get_pipeline(model_id: str, device: str, hf_token: str = "") -> Any:
             raise ImportError(
                 "Local Whisper requires the voice_local extra. Install with: uv sync --extra voice_local"
             ) from e
-    return _pipeline_cache[cache_key]
+    return cached
 
 
 def transcribe_audio(
@@ -16,7 +16,9 @@ if __name__ == "__main__":
 
     from cli.process_registry import kill_all_best_effort
     from config.settings import get_settings
+    from core.event_loop import install_uvloop
 
+    install_uvloop()
     settings = get_settings()
     try:
         # timeout_graceful_shutdown ensures uvicorn doesn't hang on task cleanup.
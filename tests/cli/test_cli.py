@@ -3,6 +3,7 @@
 import asyncio
 import json
 import os
+import sys
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -600,6 +601,141 @@ class TestCLISession:
         assert stopped is False
 
 
+def _write_fake_claude(tmp_path, sleep_s: float) -> str:
+    """Write an executable stand-in for the claude binary.
+
+    Emits one stream-json line immediately, sleeps, emits a second line,
+    then exits 0 — enough to observe overlap between concurrent tasks.
+    """
+    script = tmp_path / "fake_claude"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import time\n"
+        'print(\'{"type": "message", "content": "tick"}\', flush=True)\n'
+        f"time.sleep({sleep_s})\n"
+        'print(\'{"type": "message", "content": "done"}\', flush=True)\n'
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+class TestCLISessionConcurrency:
+    """Concurrency behavior of the lock-free start_task/stop paths."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_start_tasks_stream_without_serializing(self, tmp_path):
+        """Two start_task generators stream in parallel; is_busy counts both."""
+        from cli.session import CLISession
+
+        claude_bin = _write_fake_claude(tmp_path, sleep_s=0.5)
+        session = CLISession(
+            str(tmp_path), "http://localhost:8082/v1", claude_bin=claude_bin
+        )
+
+        # Both consumers must reach this barrier mid-stream; if start_task
+        # serialized tasks behind a lock, the second would never arrive and
+        # the wait_for below would time out.
+        barrier = asyncio.Barrier(2)
+        busy_mid: list[int] = []
+        order: list[str] = []
+
+        async def consume(tag: str) -> None:
+            first = True
+            async for event in session.start_task(f"task {tag}"):
+                if first and event.get("type") == "message":
+                    first = False
+                    order.append(f"first-{tag}")
+                    await barrier.wait()
+                    assert session.is_busy
+                    busy_mid.append(session._active_tasks)
+                elif event.get("type") == "exit":
+                    order.append(f"exit-{tag}")
+
+        await asyncio.wait_for(asyncio.gather(consume("a"), consume("b")), timeout=10)
+
+        assert busy_mid == [2, 2]
+        assert set(order[:2]) == {"first-a", "first-b"}
+        assert set(order[2:]) == {"exit-a", "exit-b"}
+        assert not session.is_busy
+        assert session._active_procs == set()
+
+    @pytest.mark.asyncio
+    async def test_stop_terminates_all_active_processes(self, tmp_path):
+        """stop() terminates every tracked process, not just the latest."""
+        from cli.session import CLISession
+
+        claude_bin = _write_fake_claude(tmp_path, sleep_s=30)
+        session = CLISession(
+            str(tmp_path), "http://localhost:8082/v1", claude_bin=claude_bin
+        )
+
+        ready = asyncio.Barrier(3)
+        exits: list[dict] = []
+
+        async def consume(tag: str) -> None:
+            async for event in session.start_task(f"task {tag}"):
+                if event.get("content") == "tick":
+                    await ready.wait()
+                elif event.get("type") == "exit":
+                    exits.append(event)
+
+        consumers = [asyncio.create_task(consume(t)) for t in ("a", "b")]
+        await asyncio.wait_for(ready.wait(), timeout=10)
+        assert session._active_tasks == 2
+
+        stopped = await session.stop()
+        assert stopped is True
+
+        await asyncio.wait_for(asyncio.gather(*consumers), timeout=10)
+        assert len(exits) == 2
+        assert all(e["code"] != 0 for e in exits)
+        assert not session.is_busy
+        assert session._active_procs == set()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_task_leaves_sibling_running(self, tmp_path):
+        """Cancelling one generator stops only that task's process."""
+        from cli.session import CLISession
+
+        claude_bin = _write_fake_claude(tmp_path, sleep_s=2.0)
+        session = CLISession(
+            str(tmp_path), "http://localhost:8082/v1", claude_bin=claude_bin
+        )
+
+        ready = asyncio.Barrier(3)
+        sibling_events: list[dict] = []
+
+        async def consume(tag: str, sink: list[dict]) -> None:
+            async for event in session.start_task(f"task {tag}"):
+                sink.append(event)
+                if event.get("content") == "tick":
+                    await ready.wait()
+
+        doomed = asyncio.create_task(consume("a", []))
+        sibling = asyncio.create_task(consume("b", sibling_events))
+        await asyncio.wait_for(ready.wait(), timeout=10)
+        # Let both consumers re-enter the generator so cancellation is
+        # delivered inside start_task rather than at the barrier above.
+        await asyncio.sleep(0.2)
+
+        doomed.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await doomed
+
+        # Only the cancelled task's process was stopped and dropped.
+        assert session._active_tasks == 1
+        assert session.is_busy
+        assert len(session._active_procs) == 1
+        (survivor,) = session._active_procs
+        assert survivor.returncode is None
+
+        await asyncio.wait_for(sibling, timeout=10)
+        assert sibling_events[-1]["type"] == "exit"
+        assert sibling_events[-1]["code"] == 0
+        assert not session.is_busy
+        assert session._active_procs == set()
+
+
 class TestCLISessionManager:
     """Test CLISessionManager."""
 
@@ -0,0 +1,50 @@
+"""Direct tests for :class:`core.lru.BoundedLRUCache`."""
+
+import pytest
+
+from core.lru import BoundedLRUCache
+
+
+def test_lru_basic_get_put():
+    cache = BoundedLRUCache(maxsize=2)
+    assert cache.get("a") is None
+    assert cache.get("a", "fallback") == "fallback"
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_lru_evicts_least_recently_used():
+    cache = BoundedLRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Touch "a" so "b" becomes the LRU entry
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_update_refreshes_recency():
+    cache = BoundedLRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 10
+
+
+def test_lru_clear():
+    cache = BoundedLRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_lru_rejects_invalid_maxsize():
+    with pytest.raises(ValueError):
+        BoundedLRUCache(maxsize=0)
@@ -301,19 +301,16 @@ class TestDiscordPlatform:
     async def test_fire_and_forget_with_coroutine(self):
         platform = DiscordPlatform(bot_token="token")
 
-        async def _task():
-            pass
-
-        coro = _task()
-        with patch("asyncio.create_task") as mock_create:
+        ran = asyncio.Event()
 
-            def _run(c):
-                return asyncio.ensure_future(c)
+        async def _task():
+            ran.set()
 
-            mock_create.side_effect = _run
-            platform.fire_and_forget(coro)
-            mock_create.assert_called_once()
-        await asyncio.sleep(0)
+        platform.fire_and_forget(_task())
+        # Executed by the bounded worker pool, not a per-call task.
+        await asyncio.wait_for(ran.wait(), timeout=1.0)
+        assert platform._send_worker_tasks
+        await platform.shutdown_send_workers()
 
     def test_on_message_registers_handler(self):
         platform = DiscordPlatform(bot_token="token")
@@ -31,8 +31,8 @@ class TestMessagingRateLimiter:
         )
         assert limiter1 is limiter2
         # First-construction wins for rate parameters
-        assert limiter1.limiter._rate_limit == 1
-        assert limiter1.limiter._rate_window == 0.5
+        assert limiter1._rate_limit == 1
+        assert limiter1._rate_window == 0.5
 
     @pytest.mark.asyncio
     async def test_compaction(self):
@@ -194,6 +194,64 @@ class TestMessagingRateLimiter:
 
         assert limiter._paused_until > 0
 
+    @pytest.mark.asyncio
+    async def test_compaction_folds_in_edits_arriving_during_token_wait(self):
+        """An edit enqueued while its predecessor waits for a token supersedes it."""
+        await MessagingRateLimiter.shutdown_instance(timeout=0.1)
+        limiter = await MessagingRateLimiter.get_instance(rate_limit=1, rate_window=0.5)
+
+        sent: list[str] = []
+
+        async def edit(content):
+            sent.append(content)
+            return content
+
+        # Consume the initial token so the next task waits for a refill.
+        await limiter.enqueue(lambda: edit("warmup"), dedup_key="warmup")
+
+        t1 = asyncio.create_task(
+            limiter.enqueue(lambda: edit("v1"), dedup_key="edit:late")
+        )
+        await asyncio.sleep(0.1)  # v1 is now popped, waiting for a token
+        t2 = asyncio.create_task(
+            limiter.enqueue(lambda: edit("v2"), dedup_key="edit:late")
+        )
+
+        results = await asyncio.gather(t1, t2)
+        assert results == ["v2", "v2"]
+        assert sent == ["warmup", "v2"]
+
+    @pytest.mark.asyncio
+    async def test_flood_backoff_reduces_rate_then_recovers(self):
+        """Flood signals halve the emission rate; successes recover it."""
+        await MessagingRateLimiter.shutdown_instance(timeout=0.1)
+        limiter = await MessagingRateLimiter.get_instance(rate_limit=4, rate_window=1.0)
+
+        base_rate = limiter._rate
+        limiter.record_flood()
+        assert limiter._rate == base_rate / 2
+
+        # Rate never drops below the configured floor
+        for _ in range(20):
+            limiter.record_flood()
+        assert limiter._rate == base_rate * limiter._MIN_RATE_FRACTION
+
+        # Sustained successes step the rate back toward the ceiling
+        reduced = limiter._rate
+        for _ in range(limiter._RECOVERY_INTERVAL):
+            limiter._record_success()
+        assert reduced < limiter._rate <= base_rate
+
+    @pytest.mark.asyncio
+    async def test_record_flood_with_seconds_pauses_worker(self):
+        """record_flood(seconds) pauses the worker in addition to backing off."""
+        await MessagingRateLimiter.shutdown_instance(timeout=0.1)
+        limiter = await MessagingRateLimiter.get_instance(rate_limit=1, rate_window=1.0)
+
+        assert limiter._paused_until == 0
+        limiter.record_flood(2)
+        assert limiter._paused_until > 0
+
     @pytest.mark.asyncio
     async def test_proactive_strict_sliding_window(self):
         """
@@ -71,6 +71,21 @@ async def test_telegram_platform_edit_message_success(telegram_platform):
     )
 
 
+@pytest.mark.asyncio
+async def test_telegram_platform_edit_message_skips_unchanged_text(telegram_platform):
+    mock_bot = AsyncMock()
+    telegram_platform._application = MagicMock()
+    telegram_platform._application.bot = mock_bot
+
+    await telegram_platform.edit_message("chat_1", "999", "same text")
+    await telegram_platform.edit_message("chat_1", "999", "same text")
+
+    mock_bot.edit_message_text.assert_called_once()
+
+    await telegram_platform.edit_message("chat_1", "999", "different text")
+    assert mock_bot.edit_message_text.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_telegram_platform_queue_send_message(telegram_platform):
     mock_limiter = AsyncMock()